@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-import re
+import contextlib
 import argparse
 from pathlib import Path
 from typing import Optional
@@ -9,55 +9,167 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+try:  # Rust-based reader, much faster than openpyxl on large workbooks
+    import python_calamine  # noqa: F401
+
+    _EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = None
+
+try:  # multithreaded CSV parser
+    import pyarrow  # noqa: F401
+
+    _CSV_ENGINE: Optional[str] = "pyarrow"
+    _STRING_DTYPE = "string[pyarrow]"
+    _HAVE_PYARROW = True
+except ImportError:
+    _CSV_ENGINE = None
+    _STRING_DTYPE = "string"
+    _HAVE_PYARROW = False
+
 # --------------------------------------------------------------------------- #
 # Funding helpers
 # --------------------------------------------------------------------------- #
 
-_SUFFIX = {"K": 1e3, "M": 1e6, "B": 1e9}
+_SUFFIX_CODE = {"K": 1, "M": 2, "B": 3}
+_MULTIPLIERS = np.array([1.0, 1e3, 1e6, 1e9])
 
 
-def _parse_funding(raw) -> float | np.nan:
-    """
-    Convert '$2.5M', '750 K', '1.2b', etc. → numeric USD.
-    Returns NaN if parsing fails.
-    """
-    if pd.isna(raw):
-        return np.nan
-
-    text = (
-        str(raw)
-        .replace(",", "")
-        .replace("$", "")
-        .replace("€", "")
-        .replace("£", "")
-        .strip()
+def _parse_funding_text(col: pd.Series) -> pd.Series:
+    """Regex path of `_parse_funding_column` for textual amounts like '$2.5M'."""
+    text = col.astype("string").str.replace(r"[,$€£\s]", "", regex=True)
+    parts = text.str.extract(r"^([\d.]+)([KMBkmb])?$")
+    number = pd.to_numeric(parts[0], errors="coerce").to_numpy(
+        dtype=float, na_value=np.nan
     )
+    code = parts[1].str.upper().map(_SUFFIX_CODE).fillna(0).to_numpy(dtype=np.intp)
+    return pd.Series(number * _MULTIPLIERS[code], index=col.index)
 
-    m = re.fullmatch(r"([\d.]+)\s*([KMB])?", text, flags=re.I)
-    if not m:
-        return np.nan
 
-    number = float(m.group(1))
-    multiplier = _SUFFIX.get(m.group(2).upper() if m.group(2) else "", 1)
-    return number * multiplier
+def _parse_funding_column(col: pd.Series) -> pd.Series:
+    """
+    Convert '$2.5M', '750 K', '1.2b', etc. → numeric USD (NaN if parsing fails).
+    Already-numeric columns skip the regex; negatives and inf become NaN.
+    """
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+        nums = col.astype(float)
+        return nums.where(np.isfinite(nums) & (nums >= 0))
+    return _parse_funding_text(col)
+
+
+_FUNDING_THRESHOLDS = (1e3, 1e6, 1e9)
+_FUNDING_FORMATS = ("${:,.0f}", "${:.0f}K", "${:.1f}M", "${:.1f}B")
+
+
+def _vec_human_funding(usd: np.ndarray) -> np.ndarray:
+    """Pretty format 12_500_000 → '$12.5M' element-wise (blank for NaN)."""
+    usd = np.asarray(usd, dtype=float)
+    mag = np.searchsorted(_FUNDING_THRESHOLDS, usd, side="right")
+    scaled = usd / _MULTIPLIERS[mag]
+    return np.array(
+        [
+            "" if np.isnan(v) else _FUNDING_FORMATS[m].format(v)
+            for v, m in zip(scaled, mag)
+        ],
+        dtype=object,
+    )
 
 
-def _human_funding(usd: float | np.nan) -> str:
-    """Pretty format 12_500_000 → '$12.5M' (blank for NaN)."""
-    if pd.isna(usd):
-        return ""
-    if usd >= 1e9:
-        return f"${usd/1e9:.1f}B"
-    if usd >= 1e6:
-        return f"${usd/1e6:.1f}M"
-    if usd >= 1e3:
-        return f"${usd/1e3:.0f}K"
-    return f"${usd:,.0f}"
+def _normalise_company(col: pd.Series) -> pd.Series:
+    """
+    Strip + title-case company names, working on each distinct raw name once.
+    Returns a categorical Series; names that collapse together share a code.
+    """
+    raw = col.astype("category")
+    titled = raw.cat.categories.astype(_STRING_DTYPE).str.strip().str.title()
+    remap, names = pd.factorize(titled)
+    codes = raw.cat.codes.to_numpy()
+    has = codes >= 0
+    codes = codes.astype(np.intp)
+    codes[has] = remap[codes[has]]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=names),
+        index=col.index,
+    )
 
 
 # --------------------------------------------------------------------------- #
 # Core routine
 # --------------------------------------------------------------------------- #
+_REQUIRED_COLUMNS = {
+    "Company",
+    "Recent Funding Amount",
+    "Using cloud marketplaces?",
+}
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    # pyarrow rejects callable usecols, so match padded headers up front
+    header = pd.read_csv(path, nrows=0).columns
+    return pd.read_csv(
+        path,
+        engine=_CSV_ENGINE,
+        usecols=[c for c in header if str(c).strip() in _REQUIRED_COLUMNS],
+    )
+
+
+def _read_excel(path: Path) -> pd.DataFrame:
+    return pd.read_excel(
+        path,
+        engine=_EXCEL_ENGINE,
+        usecols=lambda c: str(c).strip() in _REQUIRED_COLUMNS,
+    )
+
+
+_READERS = {".csv": _read_csv, ".xls": _read_excel, ".xlsx": _read_excel}
+_WRITERS = {
+    ".csv": lambda df, p: df.to_csv(p, index=False),
+    ".xls": lambda df, p: df.to_excel(p, index=False),
+    ".xlsx": lambda df, p: df.to_excel(p, index=False),
+}
+
+
+def _read_input(path: Path, ext: str) -> pd.DataFrame:
+    """Load `path` (csv/xls/xlsx) keeping only the required columns."""
+    if ext not in _READERS:
+        raise ValueError(f"Unsupported input format: {ext}")
+
+    df = _READERS[ext](path)
+    df = df.rename(columns={c: c.strip() for c in df.columns})
+
+    if not _REQUIRED_COLUMNS.issubset(df.columns):
+        missing = ", ".join(sorted(_REQUIRED_COLUMNS - set(df.columns)))
+        raise KeyError(f"Missing required column(s): {missing}")
+
+    return df
+
+
+def _read_cache(cache: Path) -> Optional[pd.DataFrame]:
+    """Load a Parquet sidecar; a corrupt one is removed and None returned."""
+    try:
+        return pd.read_parquet(cache, columns=sorted(_REQUIRED_COLUMNS))
+    except (OSError, KeyError, ValueError, NotImplementedError):
+        with contextlib.suppress(OSError):
+            cache.unlink()
+        return None
+
+
+def _write_cache(df: pd.DataFrame, cache: Path) -> None:
+    """
+    Write the Parquet sidecar via a temp file + os.replace, so an interrupted
+    write never leaves a truncated cache behind. Caching is best-effort.
+    """
+    tmp = cache.with_name(f".{cache.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp, compression="zstd", index=False)
+        os.replace(tmp, cache)
+    except (OSError, TypeError, ValueError, NotImplementedError):
+        pass  # best-effort: read-only dir, mixed-type column
+    finally:
+        with contextlib.suppress(OSError):
+            tmp.unlink(missing_ok=True)
+
+
 def top_funded_companies(
     path: str | Path,
     top_n: int = 5,
@@ -77,59 +189,62 @@ def top_funded_companies(
     path = Path(path)
     ext = path.suffix.lower()
 
-    if ext == ".csv":
-        df = pd.read_csv(path)
-    elif ext in (".xls", ".xlsx"):
-        df = pd.read_excel(path)
-    else:
-        raise ValueError(f"Unsupported input format: {ext}")
-
-
-    df = df.rename(columns={c: c.strip() for c in df.columns})
-
-    required = {
-        "Company",
-        "Recent Funding Amount",
-        "Using cloud marketplaces?",
-    }
-    if not required.issubset(df.columns):
-        missing = ", ".join(sorted(required - set(df.columns)))
-        raise KeyError(f"Missing required column(s): {missing}")
+    cache = path.with_suffix(path.suffix + ".parquet")
+    df = None
+    if (
+        _HAVE_PYARROW
+        and cache.exists()
+        and cache.stat().st_mtime >= path.stat().st_mtime
+    ):
+        df = _read_cache(cache)
+    if df is None:
+        df = _read_input(path, ext)
+        if _HAVE_PYARROW:
+            _write_cache(df, cache)
+
+    df["Company"] = _normalise_company(df["Company"])
+    df["FundingUSD"] = _parse_funding_column(df["Recent Funding Amount"])
+    df["_cloud_yes"] = (
+        df["Using cloud marketplaces?"]
+        .astype(_STRING_DTYPE)
+        .str.strip()
+        .str.lower()
+        .eq("yes")
+        .fillna(False)
+        .astype(bool)
+    )
+    df = df[df["FundingUSD"].notna() & df["Company"].notna()]
 
-    df["Company"] = df["Company"].astype(str).str.strip().str.title()
-    df["FundingUSD"] = df["Recent Funding Amount"].apply(_parse_funding)
-    df = df.dropna(subset=["Company", "FundingUSD"])
-
-    grouped = (
-        df.groupby("Company", as_index=False)
-        .agg(
-            FundingUSD=("FundingUSD", "max"),
-            UsingCloud=(
-                "Using cloud marketplaces?",
-                lambda col: "Yes"
-                if (col.astype(str).str.lower() == "yes").any()
-                else "No",
-            ),
+    if df["Company"].is_unique:
+        grouped = (
+            df[["Company", "FundingUSD", "_cloud_yes"]]
+            .nlargest(top_n, "FundingUSD")
         )
-        .sort_values("FundingUSD", ascending=False)
-        .head(top_n)
-    )
-    grouped.insert(
-        1,
-        "Recent Funding Amount",
-        grouped.pop("FundingUSD").apply(_human_funding),
+    else:
+        grouped = (
+            df.groupby("Company", as_index=False, observed=True, sort=False)
+            .agg(
+                FundingUSD=("FundingUSD", "max"),
+                _cloud_yes=("_cloud_yes", "any"),
+            )
+            .nlargest(top_n, "FundingUSD")
+        )
+    grouped = pd.DataFrame(
+        {
+            "Company": grouped["Company"].to_numpy(),
+            "Recent Funding Amount": _vec_human_funding(
+                grouped["FundingUSD"].to_numpy()
+            ),
+            "Using cloud marketplace": np.where(grouped["_cloud_yes"], "Yes", "No"),
+        }
     )
-    grouped = grouped.rename(columns={"UsingCloud": "Using cloud marketplace"})
 
     if output_path:
         output_path = Path(output_path)
         out_ext = output_path.suffix.lower()
-        if out_ext == ".csv":
-            grouped.to_csv(output_path, index=False)
-        elif out_ext in (".xls", ".xlsx"):
-            grouped.to_excel(output_path, index=False)
-        else:
+        if out_ext not in _WRITERS:
             raise ValueError(f"Unsupported output format: {out_ext}")
+        _WRITERS[out_ext](grouped, output_path)
 
     return grouped
 
@@ -1,47 +1,57 @@
 import pandas as pd
 import os
-import re
+
+try:
+    import python_calamine  # noqa: F401
+    excelEngine = 'calamine'
+except ImportError:
+    excelEngine = None
+
+try:
+    import xlsxwriter  # noqa: F401
+    writerEngine = 'xlsxwriter'
+except ImportError:
+    writerEngine = 'openpyxl'
 
 input = 'Revil Leads.xlsx'
 output = 'firmy.xlsx'
 
+allowedChars = frozenset('0123456789.BMK')
+multipliers = {'B': 1_000_000_000, 'M': 1_000_000, 'K': 1_000}
+
 def cleanMoney(money):
     if pd.isna(money):
         return 0
     if isinstance(money, str):
-        money = money.strip().upper().replace(" ", "")
-        money = re.sub(r'[^0-9.BMK]', '', money)
+        money = ''.join(filter(allowedChars.__contains__, money.upper()))
         try:
-            if 'B' in money:
-                return float(money.replace('B', '')) * 1_000_000_000
-            elif 'M' in money:
-                return float(money.replace('M', '')) * 1_000_000
-            elif 'K' in money:
-                return float(money.replace('K', '')) * 1_000
-            else:
-                return float(money)
+            for suffix, multiplier in multipliers.items():
+                if suffix in money:
+                    return float(money.replace(suffix, '')) * multiplier
+            return float(money)
         except:
             return 0
     return money
 
 def createOutput():
     try:
-        allInput = pd.read_excel(input, sheet_name=None)
-        res = []
+        cols = ['Company', 'Recent Funding Amount', 'Using cloud marketplaces?']
+        allInput = pd.read_excel(input, sheet_name=None, engine=excelEngine, usecols=lambda c: c in cols)
+        dfs = []
         for name, df in allInput.items():
-            if all(k in df.columns for k in ['Company', 'Recent Funding Amount', 'Using cloud marketplaces?']):
-                filtered = df[['Company', 'Recent Funding Amount', 'Using cloud marketplaces?']].drop_duplicates()
-                res.append(filtered)
+            if set(cols).issubset(df.columns):
+                dfs.append(df[cols])
             else:
                 print(f"Pominięto arkusz '{name}' – brak wymaganych kolumn.")
 
-        joint = pd.concat(res, ignore_index=True)
+        joint = pd.concat(dfs, ignore_index=True)
         nonReps = joint.drop_duplicates(subset='Company').copy()
         nonReps['Recent Funding Amount (USD)'] = nonReps['Recent Funding Amount'].apply(cleanMoney)
         nonReps = nonReps.sort_values(by='Recent Funding Amount (USD)', ascending=False)
         nonReps = nonReps.drop(columns=['Recent Funding Amount'])
 
-        nonReps.to_excel(output, index=False)
+        with pd.ExcelWriter(output, engine=writerEngine) as w:
+            nonReps.to_excel(w, index=False)
         print(f"Zapisano {len(nonReps)} firm do pliku: {output}")
         print(f"Folder: {os.getcwd()}")
 